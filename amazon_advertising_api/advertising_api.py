@@ -1,15 +1,147 @@
 from amazon_advertising_api.regions import regions
 from amazon_advertising_api.versions import versions
-from io import BytesIO
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import urllib.request
 import urllib.parse
+from urllib.parse import quote_plus
+import http.client
+import threading
+import selectors
+import socket
+import time
 import gzip
-import json
+import io
+
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_default(obj):
+        # numpy arrays and scalars
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        raise TypeError(
+            f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    def _json_dumps(obj):
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+
+    _json_loads = json.loads
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from deflate import gzip_decompress as _gzip_decompress
+except ImportError:
+    _gzip_decompress = gzip.decompress
+
+
+_API_VERSION = versions['api_version']
+_USER_AGENT = 'AdvertisingAPI Python Client Library v{}'.format(
+    versions['application_version'])
+
+# Lifetime in seconds and maximum number of cached profile responses.
+_PROFILE_CACHE_TTL = 3600
+_PROFILE_CACHE_SIZE = 128
+
+# Chunk size used when streaming and decompressing report downloads.
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Compressed downloads up to this size are decompressed in a single call.
+_MAX_ONE_SHOT_SIZE = 64 * 1024 * 1024
+
+
+def _read_gzip(res):
+    """
+    Reads and decompresses a gzipped response body. Bodies of known size up
+    to _MAX_ONE_SHOT_SIZE are decompressed in one call, larger or unsized
+    ones are streamed through GzipFile.
+    """
+    length = res.headers.get('Content-Length')
+    if length is not None and int(length) <= _MAX_ONE_SHOT_SIZE:
+        return _gzip_decompress(res.read())
+
+    f = gzip.GzipFile(fileobj=io.BufferedReader(
+        res, buffer_size=_READ_BUFFER_SIZE))
+    return b''.join(iter(lambda: f.read(_READ_BUFFER_SIZE), b''))
+
+
+def _select_keys(data, keys):
+    """
+    Parses a JSON array of objects, keeping only the given keys of each
+    object. Uses simdjson when available so that unused fields are never
+    converted to Python objects.
+    """
+    if simdjson is None:
+        return [{k: row.get(k) for k in keys} for row in _json_loads(data)]
+
+    rows = []
+    for row in simdjson.Parser().parse(data):
+        values = {}
+        for k in keys:
+            value = row.get(k)
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                value = value.as_list()
+            values[k] = value
+        rows.append(values)
+    return rows
+
+
+def _iter_rows(res, keys):
+    """
+    Yields the rows of a gzipped JSON array download as they are parsed,
+    optionally keeping only the given keys. The response is closed once
+    iteration ends or the generator is closed.
+    """
+    try:
+        f = gzip.GzipFile(fileobj=io.BufferedReader(
+            res, buffer_size=_READ_BUFFER_SIZE))
+        for row in ijson.items(f, 'item', use_float=True):
+            if keys is not None:
+                row = {k: row.get(k) for k in keys}
+            yield row
+    finally:
+        res.close()
+
+
+def _unquote(token):
+    """Returns a token in its decoded form, as tokens are stored."""
+    if token and '%' in token:
+        return urllib.parse.unquote(token)
+    return token
 
 
 class AdvertisingApi:
 
-    """Lightweight client library for Amazon Sponsored Products API."""
+    """
+    Lightweight client library for Amazon Sponsored Products API.
+
+    Instances use __slots__, so attributes other than the ones listed there
+    cannot be set on them.
+    """
+
+    __slots__ = ('client_id', 'client_secret', '_access_token',
+                 '_refresh_token', '_profile_id', '_api_version',
+                 '_user_agent', '_token_url', '_endpoint', '_http',
+                 '_base_headers', '_url_prefix', '_token_full_url',
+                 '_profile_cache')
 
     def __init__(self,
                  client_id,
@@ -37,23 +169,24 @@ class AdvertisingApi:
         """
         self.client_id = client_id
         self.client_secret = client_secret
-        self._access_token = access_token
+        self._access_token = _unquote(access_token)
+        self._profile_cache = {}
         self.refresh_token = refresh_token
 
-        self.api_version = versions['api_version']
-        self.user_agent = 'AdvertisingAPI Python Client Library v{}'.format(
-            versions['application_version'])
+        try:
+            region_urls = regions[region]
+        except KeyError:
+            raise KeyError(
+                f'Region {region!r} not found in regions.') from None
+
+        self._api_version = _API_VERSION
+        self._user_agent = _USER_AGENT
         self.profile_id = None
-        self.token_url = None
+        self._http = ConnectionPool(maxsize=16)
 
-        if region in regions:
-            if sandbox:
-                self.endpoint = regions[region]['sandbox']
-            else:
-                self.endpoint = regions[region]['prod']
-            self.token_url = regions[region]['token_url']
-        else:
-            raise KeyError('Region {} not found in regions.'.format(regions))
+        self._endpoint = region_urls['sandbox' if sandbox else 'prod']
+        self._token_url = region_urls['token_url']
+        self._build_urls()
 
     @property
     def access_token(self):
@@ -62,7 +195,89 @@ class AdvertisingApi:
     @access_token.setter
     def access_token(self, value):
         """Set access_token"""
-        self._access_token = value
+        self._access_token = _unquote(value)
+        self._profile_cache.clear()
+        self._build_headers()
+
+    @property
+    def refresh_token(self):
+        return self._refresh_token
+
+    @refresh_token.setter
+    def refresh_token(self, value):
+        """Set refresh_token"""
+        self._refresh_token = _unquote(value)
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @endpoint.setter
+    def endpoint(self, value):
+        """Set endpoint"""
+        self._endpoint = value
+        self._build_urls()
+
+    @property
+    def api_version(self):
+        return self._api_version
+
+    @api_version.setter
+    def api_version(self, value):
+        """Set api_version"""
+        self._api_version = value
+        self._build_urls()
+
+    @property
+    def token_url(self):
+        return self._token_url
+
+    @token_url.setter
+    def token_url(self, value):
+        """Set token_url"""
+        self._token_url = value
+        self._build_urls()
+
+    def _build_urls(self):
+        """
+        Rebuilds the API URL prefix and token URL. Called whenever the
+        endpoint, API version or token URL changes.
+        """
+        self._url_prefix = f'https://{self._endpoint}/{self._api_version}/'
+        self._token_full_url = f'https://{self._token_url}'
+
+    @property
+    def user_agent(self):
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, value):
+        """Set user_agent"""
+        self._user_agent = value
+        self._build_headers()
+
+    @property
+    def profile_id(self):
+        return self._profile_id
+
+    @profile_id.setter
+    def profile_id(self, value):
+        """Set profile_id"""
+        self._profile_id = value
+        self._build_headers()
+
+    def _build_headers(self):
+        """
+        Rebuilds the headers sent with every API call. Called whenever the
+        access token or profile Id changes so calls don't rebuild them.
+        """
+        headers = {'Authorization': f'Bearer {self._access_token}',
+                   'Content-Type': 'application/json',
+                   'Accept-Encoding': 'gzip',
+                   'User-Agent': self._user_agent}
+        if self._profile_id:
+            headers['Amazon-Advertising-API-Scope'] = self._profile_id
+        self._base_headers = headers
 
     def do_refresh_token(self):
         if self.refresh_token is None:
@@ -70,42 +285,38 @@ class AdvertisingApi:
                     'code': 0,
                     'response': 'refresh_token is empty.'}
 
-        self._access_token = urllib.parse.unquote(self._access_token)
-        self.refresh_token = urllib.parse.unquote(self.refresh_token)
+        data = ('grant_type=refresh_token'
+                f'&refresh_token={quote_plus(self.refresh_token)}'
+                f'&client_id={quote_plus(self.client_id)}'
+                f'&client_secret={quote_plus(self.client_secret)}')
 
-        params = {
-            'grant_type': 'refresh_token',
-            'refresh_token': self.refresh_token,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret}
+        res = self._http.request(
+            'POST',
+            self._token_full_url,
+            body=data.encode('utf-8'),
+            headers={'Content-Type': 'application/x-www-form-urlencoded'})
 
-        data = urllib.parse.urlencode(params)
-
-        req = urllib.request.Request(
-            url='https://{}'.format(self.token_url),
-            data=data.encode('utf-8'))
+        if res.status >= 400:
+            return {'success': False,
+                    'code': res.status,
+                    'response': res.reason}
 
-        try:
-            f = urllib.request.urlopen(req)
-            response = f.read().decode('utf-8')
-            if 'access_token' in response:
-                json_data = json.loads(response)
-                self._access_token = json_data['access_token']
-                return {'success': True,
-                        'code': f.code,
-                        'response': self._access_token}
-            else:
-                return {'success': False,
-                        'code': f.code,
-                        'response': 'access_token not in response.'}
-        except urllib.error.HTTPError as e:
+        response = res.data.decode('utf-8')
+        if 'access_token' in response:
+            json_data = _json_loads(response)
+            self.access_token = json_data['access_token']
+            return {'success': True,
+                    'code': res.status,
+                    'response': self._access_token}
+        else:
             return {'success': False,
-                    'code': e.code,
-                    'response': e.msg}
+                    'code': res.status,
+                    'response': 'access_token not in response.'}
 
     def get_profiles(self):
         """
-        Retrieves profiles associated with an auth token.
+        Retrieves profiles associated with an auth token. Successful responses
+        are cached for an hour, see **clear_profile_cache**.
 
         :GET: /profiles
         :returns:
@@ -113,11 +324,12 @@ class AdvertisingApi:
             :401: Unauthorized
         """
         interface = 'profiles'
-        return self._operation(interface)
+        return self._cached_operation(interface)
 
     def get_profile(self, profile_id):
         """
-        Retrieves a single profile by Id.
+        Retrieves a single profile by Id. Successful responses are cached for
+        an hour, see **clear_profile_cache**.
 
         :GET: /profiles/{profileId}
         :param profile_id: The Id of the requested profile.
@@ -127,8 +339,8 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Profile not found
         """
-        interface = 'profiles/{}'.format(profile_id)
-        return self._operation(interface)
+        interface = f'profiles/{profile_id}'
+        return self._cached_operation(interface)
 
     def update_profiles(self, data):
         """
@@ -146,8 +358,17 @@ class AdvertisingApi:
             :401: Unauthorized
         """
         interface = 'profiles'
+        self._profile_cache.clear()
         return self._operation(interface, data, method='PUT')
 
+    def clear_profile_cache(self):
+        """
+        Drops cached **get_profiles** and **get_profile** responses. The
+        cache is also cleared by **update_profiles** and whenever the access
+        token changes.
+        """
+        self._profile_cache.clear()
+
     def get_campaign(self, campaign_id):
         """
         Retrieves a campaign by Id. Note that this call returns the minimal
@@ -161,7 +382,7 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Campaign not found
         """
-        interface = 'campaigns/{}'. format(campaign_id)
+        interface = f'campaigns/{campaign_id}'
         return self._operation(interface)
 
     def get_campaign_ex(self, campaign_id):
@@ -180,7 +401,7 @@ class AdvertisingApi:
             :404: Campaign not found
 
         """
-        interface = 'campaigns/extended/{}'. format(campaign_id)
+        interface = f'campaigns/extended/{campaign_id}'
         return self._operation(interface)
 
     def create_campaigns(self, data):
@@ -201,6 +422,24 @@ class AdvertisingApi:
         interface = 'campaigns'
         return self._operation(interface, data, method='POST')
 
+    def create_campaigns_chunked(self, data, chunk=100):
+        """
+        Creates any number of campaigns by splitting them into batches the API
+        accepts and sending the batches concurrently. See **create_campaigns**.
+
+        :param data: A list of campaigns to be created.
+        :type data: List of **Campaign**
+        :param chunk: Number of campaigns per request, at most 100.
+        :type chunk: integer
+        :returns: List of **create_campaigns** results, one per batch, in the
+            same order as the input.
+        """
+        if not 1 <= chunk <= 100:
+            raise ValueError('chunk must be between 1 and 100.')
+        return self.bulk(
+            [('create_campaigns', (data[i:i + chunk],), {})
+             for i in range(0, len(data), chunk)])
+
     def update_campaigns(self, data):
         """
         Updates one or more campaigns.  Campaigns are identified using their
@@ -232,7 +471,7 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Campaign not found
         """
-        interface = 'campaigns/{}'.format(campaign_id)
+        interface = f'campaigns/{campaign_id}'
         return self._operation(interface, method='DELETE')
 
     def list_campaigns(self, data=None):
@@ -296,7 +535,7 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Ad group not found
         """
-        interface = 'adGroups/{}'.format(ad_group_id)
+        interface = f'adGroups/{ad_group_id}'
         return self._operation(interface)
 
     def get_ad_group_ex(self, ad_group_id):
@@ -315,7 +554,7 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Ad group not found
         """
-        interface = 'adGroups/extended/{}'.format(ad_group_id)
+        interface = f'adGroups/extended/{ad_group_id}'
         return self._operation(interface)
 
     def create_ad_groups(self, data):
@@ -369,7 +608,7 @@ class AdvertisingApi:
             :401: Unauthorized
             :404: Ad group not found
         """
-        interface = 'adGroups/{}'.format(ad_group_id)
+        interface = f'adGroups/{ad_group_id}'
         return self._operation(interface, method='DELETE')
 
     def list_ad_groups(self, data=None):
@@ -463,7 +702,7 @@ class AdvertisingApi:
             :401: Unauthorized.
             :404: Keyword not found.
         """
-        interface = 'keywords/{}'.format(keyword_id)
+        interface = f'keywords/{keyword_id}'
         return self._operation(interface)
 
     def get_biddable_keyword_ex(self, keyword_id):
@@ -482,7 +721,7 @@ class AdvertisingApi:
             :401: Unauthorized.
             :404: Keyword not found.
         """
-        interface = 'keywords/extended/{}'.format(keyword_id)
+        interface = f'keywords/extended/{keyword_id}'
         return self._operation(interface)
 
     def create_biddable_keywords(self, data):
@@ -504,7 +743,7 @@ class AdvertisingApi:
         return self._operation(interface, data, method='PUT')
 
     def archive_biddable_keyword(self, keyword_id):
-        interface = 'keywords/{}'.format(keyword_id)
+        interface = f'keywords/{keyword_id}'
         return self._operation(interface, method='DELETE')
 
     def list_biddable_keywords(self, data=None):
@@ -516,11 +755,11 @@ class AdvertisingApi:
         return self._operation(interface, data)
 
     def get_negative_keyword(self, negative_keyword_id):
-        interface = 'negativeKeywords/{}'.format(negative_keyword_id)
+        interface = f'negativeKeywords/{negative_keyword_id}'
         return self._operation(interface)
 
     def get_negative_keyword_ex(self, negative_keyword_id):
-        interface = 'negativeKeywords/extended/{}'.format(negative_keyword_id)
+        interface = f'negativeKeywords/extended/{negative_keyword_id}'
         return self._operation(interface)
 
     def create_negative_keywords(self, data):
@@ -532,7 +771,7 @@ class AdvertisingApi:
         return self._operation(interface, data, method='PUT')
 
     def archive_negative_keyword(self, negative_keyword_id):
-        interface = 'negativeKeywords/{}'.format(negative_keyword_id)
+        interface = f'negativeKeywords/{negative_keyword_id}'
         return self._operation(interface, method='DELETE')
 
     def list_negative_keywords(self, data=None):
@@ -544,13 +783,13 @@ class AdvertisingApi:
         return self._operation(interface, data)
 
     def get_campaign_negative_keyword(self, campaign_negative_keyword_id):
-        interface = 'campaignNegativeKeywords/{}'.format(
-            campaign_negative_keyword_id)
+        interface = (
+            f'campaignNegativeKeywords/{campaign_negative_keyword_id}')
         return self._operation(interface)
 
     def get_campaign_negative_keyword_ex(self, campaign_negative_keyword_id):
-        interface = 'campaignNegativeKeywords/extended/{}'.format(
-            campaign_negative_keyword_id)
+        interface = ('campaignNegativeKeywords/extended/'
+                     f'{campaign_negative_keyword_id}')
         return self._operation(interface)
 
     def create_campaign_negative_keywords(self, data):
@@ -562,8 +801,8 @@ class AdvertisingApi:
         return self._operation(interface, data, method='PUT')
 
     def remove_campaign_negative_keyword(self, campaign_negative_keyword_id):
-        interface = 'campaignNegativeKeywords/{}'.format(
-            campaign_negative_keyword_id)
+        interface = (
+            f'campaignNegativeKeywords/{campaign_negative_keyword_id}')
         return self._operation(interface, method='DELETE')
 
     def list_campaign_negative_keywords(self, data=None):
@@ -575,11 +814,11 @@ class AdvertisingApi:
         return self._operation(interface, data)
 
     def get_product_ad(self, product_ad_id):
-        interface = 'productAds/{}'.format(product_ad_id)
+        interface = f'productAds/{product_ad_id}'
         return self._operation(interface)
 
     def get_product_ad_ex(self, product_ad_id):
-        interface = 'productAds/extended/{}'.format(product_ad_id)
+        interface = f'productAds/extended/{product_ad_id}'
         return self._operation(interface)
 
     def create_product_ads(self, data):
@@ -603,82 +842,180 @@ class AdvertisingApi:
 
     def request_snapshot(self, record_type=None, snapshot_id=None, data=None):
         if record_type is not None:
-            interface = '{}/snapshot'.format(record_type)
+            interface = f'{record_type}/snapshot'
             return self._operation(interface, data, method='POST')
         elif snapshot_id is not None:
-            interface = 'snapshots/{}'.format(snapshot_id)
+            interface = f'snapshots/{snapshot_id}'
             return self._operation(interface, data)
 
     def request_report(self, record_type=None, report_id=None, data=None):
         if record_type is not None:
-            interface = '{}/report'.format(record_type)
+            interface = f'{record_type}/report'
             return self._operation(interface, data, method='POST')
         elif report_id is not None:
-            interface = 'reports/{}'.format(report_id)
+            interface = f'reports/{report_id}'
             return self._operation(interface)
 
-    def get_report(self, report_id):
-        interface = 'reports/{}'.format(report_id)
-        res = self._operation(interface)
-        if json.loads(res['response'])['status'] == 'SUCCESS':
-            res = self._download(
-                location=json.loads(res['response'])['location'])
-            return res
-        else:
-            return res
+    def get_report(self, report_id, *, keys=None):
+        """
+        Downloads a report if it is ready, otherwise returns its status.
+
+        :param report_id: The Id of the requested report.
+        :type report_id: string
+        :param keys: Optional, only keep these fields of each report row.
+        :type keys: List of string
+        """
+        interface = f'reports/{report_id}'
+        return self._download_if_ready(interface, keys=keys)
+
+    def get_report_stream(self, report_id, *, keys=None):
+        """
+        Like **get_report**, but the response of a ready report is an iterator
+        over its rows, parsed incrementally while the download is read.
+        Requires the ijson package.
+
+        :param report_id: The Id of the requested report.
+        :type report_id: string
+        :param keys: Optional, only keep these fields of each report row.
+        :type keys: List of string
+        """
+        if ijson is None:
+            raise ImportError('get_report_stream requires the ijson package.')
+        interface = f'reports/{report_id}'
+        return self._download_if_ready(interface, keys=keys, stream=True)
 
     def get_snapshot(self, snapshot_id):
-        interface = 'snapshots/{}'.format(snapshot_id)
-        res = self._operation(interface)
-        if json.loads(res['response'])['status'] == 'SUCCESS':
+        interface = f'snapshots/{snapshot_id}'
+        return self._download_if_ready(interface)
+
+    def _download_if_ready(self, interface, keys=None, stream=False):
+        """
+        Checks the status of a report or snapshot and downloads it once it is
+        ready. Otherwise returns the status response. See _download for
+        **keys** and **stream**.
+
+        :param interface: Status interface of the report or snapshot.
+        :type interface: string
+        """
+        res = self._operation_raw(interface)
+        if not res['success']:
+            return res
+        status = _json_loads(res['response'])
+        if status['status'] == 'SUCCESS':
             res = self._download(
-                location=json.loads(res['response'])['location'])
+                location=status['location'], keys=keys, stream=stream)
             return res
         else:
+            res['response'] = res['response'].decode('utf-8')
             return res
 
-    def _download(self, location):
-        headers = {'Authorization': 'Bearer {}'.format(self._access_token),
-                   'Content-Type': 'application/json',
-                   'User-Agent': self.user_agent}
+    def bulk(self, operations):
+        """
+        Runs several client calls concurrently over the shared connection
+        pool.
 
-        if self.profile_id is not None:
-            headers['Amazon-Advertising-API-Scope'] = self.profile_id
-        else:
+        :param operations: Calls to make, as (method_name, args, kwargs)
+            tuples, e.g. ('create_ad_groups', (ad_groups,), {}).
+        :type operations: List of tuple
+        :returns: List of results in the same order as **operations**.
+        """
+        def call(operation):
+            name, args, kwargs = operation
+            return getattr(self, name)(*args, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=self._http.maxsize) as executor:
+            return list(executor.map(call, operations))
+
+    def _download(self, location, keys=None, stream=False):
+        """
+        Follows the redirect at **location** and decompresses the report or
+        snapshot file it points to.
+
+        :param location: Download location from the status response.
+        :type location: string
+        :param keys: Optional, only keep these fields of each row.
+        :type keys: List of string
+        :param stream: Return an iterator over the rows instead of a list.
+        :type stream: boolean
+        """
+        if self.profile_id is None:
             raise ValueError('Invalid profile Id.')
 
-        opener = urllib.request.build_opener(NoRedirectHandler())
-        urllib.request.install_opener(opener)
-        req = urllib.request.Request(url=location, headers=headers, data=None)
+        response = self._http.request(
+            'GET', location, headers=self._base_headers)
+        if response.status >= 400:
+            return {'success': False,
+                    'code': response.status,
+                    'response': response.reason}
+        if response.status != 307:
+            return {'success': False,
+                    'code': response.status,
+                    'response': 'Location not found.'}
+        if response.headers.get('Location') is None:
+            return {'success': False,
+                    'code': response.status,
+                    'response': 'Location is empty.'}
+
+        req = urllib.request.Request(url=response.headers['Location'])
         try:
-            response = urllib.request.urlopen(req)
-            if 'location' in response:
-                if response['location'] is not None:
-                    req = urllib.request.Request(url=response['location'])
-                    res = urllib.request.urlopen(req)
-                    res_data = res.read()
-                    buf = BytesIO(res_data)
-                    f = gzip.GzipFile(fileobj=buf)
-                    data = f.read()
-                    return {'success': True,
-                            'code': res.code,
-                            'response': json.loads(data.decode('utf-8'))}
-                else:
-                    return {'success': False,
-                            'code': res.code,
-                            'response': 'Location is empty.'}
-            else:
-                return {'success': False,
-                        'code': res.code,
-                        'response': 'Location not found.'}
+            res = urllib.request.urlopen(req)
         except urllib.error.HTTPError as e:
             return {'success': False,
                     'code': e.code,
                     'response': e.msg}
 
+        if stream:
+            return {'success': True,
+                    'code': res.code,
+                    'response': _iter_rows(res, keys)}
+
+        data = _read_gzip(res)
+        if keys is not None:
+            rows = _select_keys(data, keys)
+        else:
+            rows = _json_loads(data)
+        return {'success': True,
+                'code': res.code,
+                'response': rows}
+
+    def _cached_operation(self, interface):
+        """
+        GET call whose successful responses are cached per interface for
+        _PROFILE_CACHE_TTL seconds. Failed calls drop the cached entry.
+
+        :param interface: Interface used for this call.
+        :type interface: string
+        """
+        cache = self._profile_cache
+        now = time.monotonic()
+        entry = cache.get(interface)
+        if entry is not None and entry[0] > now:
+            return dict(entry[1])
+
+        res = self._operation(interface)
+        if not res['success']:
+            cache.pop(interface, None)
+            return res
+
+        if interface not in cache and len(cache) >= _PROFILE_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        cache[interface] = (now + _PROFILE_CACHE_TTL, res)
+        return dict(res)
+
     def _operation(self, interface, params=None, method='GET'):
         """
-        Makes that actual API call.
+        Makes that actual API call and returns the response body as a string.
+        See _operation_raw for the parameters.
+        """
+        res = self._operation_raw(interface, params, method)
+        if res['success']:
+            res['response'] = res['response'].decode('utf-8')
+        return res
+
+    def _operation_raw(self, interface, params=None, method='GET'):
+        """
+        Makes that actual API call. On success the response body is returned
+        undecoded, as bytes, so it can be handed straight to the JSON parser.
 
         :param interface: Interface used for this call.
         :type interface: string
@@ -692,62 +1029,178 @@ class AdvertisingApi:
                     'code': 0,
                     'response': 'access_token is empty.'}
 
-        headers = {'Authorization': 'bearer {}'.format(self._access_token),
-                   'Content-Type': 'application/json',
-                   'User-Agent': self.user_agent}
-
-        if self.profile_id is not None and self.profile_id != '':
-            headers['Amazon-Advertising-API-Scope'] = self.profile_id
-
+        url = self._url_prefix + interface
         data = None
 
-        if method == 'GET':
-            if params is not None:
-                p = '?{}'.format(urllib.parse.urlencode(params))
+        if params:
+            if method == 'GET':
+                url += '?' + urllib.parse.urlencode(params)
             else:
-                p = ''
+                data = _json_dumps(params)
 
-            url = 'https://{host}/{api_version}/{interface}{params}'.format(
-                host=self.endpoint,
-                api_version=self.api_version,
-                interface=interface,
-                params=p)
-        else:
-            if params is not None:
-                data = json.dumps(params).encode('utf-8')
+        res = self._http.request(
+            method, url, body=data, headers=self._base_headers)
+        if method == 'GET':
+            # Follow redirects like urllib did, up to the same limit.
+            redirects = 0
+            while (300 <= res.status < 400 and 'Location' in res.headers
+                   and redirects < _MAX_REDIRECTS):
+                url = urllib.parse.urljoin(url, res.headers['Location'])
+                res = self._http.request(
+                    'GET', url, headers=self._base_headers)
+                redirects += 1
+        if res.status >= 300:
+            return {'success': False,
+                    'code': res.status,
+                    'response': res.reason}
+        return {'success': True,
+                'code': res.status,
+                'response': res.data}
 
-            url = 'https://{host}/{api_version}/{interface}'.format(
-                host=self.endpoint,
-                api_version=self.api_version,
-                interface=interface)
 
-        req = urllib.request.Request(url=url, headers=headers, data=data)
-        req.method = method
+# Maximum number of redirects followed by a GET API call.
+_MAX_REDIRECTS = 10
 
-        try:
-            f = urllib.request.urlopen(req)
-            return {'success': True,
-                    'code': f.code,
-                    'response': f.read().decode('utf-8')}
-        except urllib.error.HTTPError as e:
-            return {'success': False,
-                    'code': e.code,
-                    'response': e.msg}
+# Methods that are safe to resend when a reused connection fails.
+_IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'PUT', 'DELETE'))
 
+def _is_connection_dropped(conn):
+    """
+    Checks whether an idle connection has been closed by the server. An idle
+    keep-alive socket that is readable has either hit EOF or received data
+    nobody asked for; either way it can't be reused.
+    """
+    if conn.sock is None:
+        return True
+    with selectors.DefaultSelector() as selector:
+        selector.register(conn.sock, selectors.EVENT_READ)
+        return bool(selector.select(timeout=0))
 
-class NoRedirectHandler(urllib.request.HTTPErrorProcessor):
 
-    """Handles report and snapshot redirects."""
+_PooledResponse = namedtuple('_PooledResponse', 'status reason headers data')
 
-    def http_response(self, request, response):
-        if response.code == 307:
-            if 'Location' in response.headers:
-                return {'code': 307,
-                        'location': response.headers['Location']}
-            else:
-                return {'code': response.code, 'location': None}
+
+class ConnectionPool:
+
+    """
+    Thread-safe pool of keep-alive HTTPS connections, keyed by host.
+
+    Reusing connections between calls avoids a new TCP and TLS handshake for
+    every request made through the client.
+    """
+
+    def __init__(self, maxsize=16, timeout=None, max_idle_time=30):
+        """
+        :param maxsize: Maximum number of idle connections kept per host.
+        :type maxsize: integer
+        :param timeout: Socket timeout in seconds for each connection.
+            Defaults to socket.getdefaulttimeout(), which is no timeout
+            unless one has been set globally, as with urllib.
+        :type timeout: float
+        :param max_idle_time: Idle connections older than this many seconds
+            are closed instead of reused.
+        :type max_idle_time: float
+        """
+        self.maxsize = maxsize
+        if timeout is None:
+            timeout = socket.getdefaulttimeout()
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        """
+        Sends a request and reads the full response body, decompressing it if
+        it is gzip encoded. Redirects are not followed.
+
+        :param method: HTTP method.
+        :type method: string
+        :param url: Absolute https URL.
+        :type url: string
+        :param body: Request body.
+        :type body: bytes
+        :param headers: Request headers.
+        :type headers: dictionary
+        :returns: _PooledResponse with status, reason, headers and data.
+        """
+        parts = urllib.parse.urlsplit(url)
+        host = parts.netloc
+        path = parts.path or '/'
+        if parts.query:
+            path = '{}?{}'.format(path, parts.query)
+
+        conn, reused = self._acquire(host)
+        try:
+            res = self._send(conn, method, path, body, headers)
+        except (http.client.HTTPException, ConnectionError):
+            conn.close()
+            if not reused or method not in _IDEMPOTENT_METHODS:
+                raise
+            # The server may have dropped an idle keep-alive connection;
+            # retry idempotent requests once on a fresh one. Others may
+            # already have been processed, so resending could duplicate them.
+            conn = self._connect(host)
+            try:
+                res = self._send(conn, method, path, body, headers)
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        try:
+            data = res.read()
+            if res.headers.get('Content-Encoding') == 'gzip':
+                data = _gzip_decompress(data)
+        except Exception:
+            conn.close()
+            raise
+        if res.will_close:
+            conn.close()
         else:
-            return urllib.request.HTTPErrorProcessor.http_response(
-                self, request, response)
+            self._release(host, conn)
+        return _PooledResponse(res.status, res.reason, res.headers, data)
 
-    https_response = http_response
+    def close(self):
+        """Closes all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def _connect(self, host):
+        return http.client.HTTPSConnection(host, timeout=self.timeout)
+
+    def _acquire(self, host):
+        """
+        Returns (connection, reused). Idle connections that have expired or
+        that the server has closed are discarded, so a request is only sent
+        on a reused connection that still looks alive.
+        """
+        while True:
+            with self._lock:
+                conns = self._idle.get(host)
+                if not conns:
+                    break
+                conn, released_at = conns.pop()
+            if (time.monotonic() - released_at <= self.max_idle_time
+                    and not _is_connection_dropped(conn)):
+                return conn, True
+            conn.close()
+        return self._connect(host), False
+
+    def _release(self, host, conn):
+        with self._lock:
+            conns = self._idle.setdefault(host, [])
+            if len(conns) < self.maxsize:
+                conns.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    @staticmethod
+    def _send(conn, method, path, body, headers):
+        conn.request(method, path, body=body, headers=headers or {})
+        return conn.getresponse()
@@ -0,0 +1,134 @@
+import http.client
+import socket
+import threading
+import time
+import unittest
+import unittest.mock
+
+from amazon_advertising_api.advertising_api import ConnectionPool
+
+
+class HTTPConnectionPool(ConnectionPool):
+
+    """ConnectionPool over plain HTTP, for talking to the local test server."""
+
+    def _connect(self, host):
+        return http.client.HTTPConnection(host, timeout=5)
+
+
+class KeepAliveServer:
+
+    """
+    Minimal HTTP/1.1 server that answers every request with a keep-alive
+    200 response. With close_after_response set it then closes the socket
+    anyway, like a server dropping an idle keep-alive connection.
+    """
+
+    def __init__(self, close_after_response=False):
+        self.close_after_response = close_after_response
+        self.accepted = 0
+        self.methods = []
+        self._sock = socket.socket()
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen()
+        self.url = 'http://127.0.0.1:{}/'.format(self._sock.getsockname()[1])
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def close(self):
+        self._sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(
+                target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        f = conn.makefile('rb')
+        with conn, f:
+            while True:
+                request_line = f.readline()
+                if not request_line:
+                    return
+                length = 0
+                for line in iter(f.readline, b'\r\n'):
+                    name, _, value = line.decode('latin-1').partition(':')
+                    if name.lower() == 'content-length':
+                        length = int(value)
+                f.read(length)
+                self.methods.append(request_line.split()[0].decode())
+                conn.sendall(b'HTTP/1.1 200 OK\r\n'
+                             b'Content-Length: 2\r\n\r\n{}')
+                if self.close_after_response:
+                    return
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def wait_for_close(self):
+        # Give the server's FIN time to reach the idle client socket.
+        time.sleep(0.1)
+
+    def test_reuses_idle_connection(self):
+        server = KeepAliveServer()
+        self.addCleanup(server.close)
+        pool = HTTPConnectionPool()
+        self.addCleanup(pool.close)
+
+        self.assertEqual(pool.request('GET', server.url).data, b'{}')
+        self.assertEqual(pool.request('POST', server.url, b'[]').data, b'{}')
+        self.assertEqual(server.accepted, 1)
+
+    def test_post_after_server_closed_idle_connection(self):
+        server = KeepAliveServer(close_after_response=True)
+        self.addCleanup(server.close)
+        pool = HTTPConnectionPool()
+        self.addCleanup(pool.close)
+
+        pool.request('GET', server.url)
+        self.wait_for_close()
+        res = pool.request('POST', server.url, b'[]')
+
+        self.assertEqual(res.status, 200)
+        self.assertEqual(server.methods, ['GET', 'POST'])
+        self.assertEqual(server.accepted, 2)
+
+    def test_expired_idle_connection_is_not_reused(self):
+        server = KeepAliveServer()
+        self.addCleanup(server.close)
+        pool = HTTPConnectionPool(max_idle_time=0)
+        self.addCleanup(pool.close)
+
+        pool.request('GET', server.url)
+        time.sleep(0.01)
+        pool.request('GET', server.url)
+
+        self.assertEqual(server.accepted, 2)
+
+    def test_undetected_drop_retries_get_but_not_post(self):
+        server = KeepAliveServer(close_after_response=True)
+        self.addCleanup(server.close)
+        pool = HTTPConnectionPool()
+        self.addCleanup(pool.close)
+
+        pool.request('GET', server.url)
+        self.wait_for_close()
+        # Simulate the server closing the socket right after the check.
+        with unittest.mock.patch(
+                'amazon_advertising_api.advertising_api'
+                '._is_connection_dropped', return_value=False):
+            self.assertEqual(pool.request('GET', server.url).status, 200)
+            self.wait_for_close()
+            with self.assertRaises((ConnectionError,
+                                    http.client.HTTPException)):
+                pool.request('POST', server.url, b'[]')
+
+        self.assertEqual(server.methods, ['GET', 'GET'])
+
+
+if __name__ == '__main__':
+    unittest.main()